@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Tuple, List
 
@@ -20,6 +22,9 @@ UPLOAD_URL = "https://uploadsvc2.astrolabs.pl/upload/"
 # next to this module. You can move this wherever you prefer.
 CREDENTIALS_FILE = Path(__file__).with_name("bhtom_credentials.json")
 
+# Files uploaded at the same time; each upload is mostly waiting on the network.
+UPLOAD_WORKERS = 4
+
 
 # ---------------------------------------------------------------------------
 # Low-level API
@@ -73,62 +78,90 @@ def get_auth_token(username: str, password: str) -> str:
 # Upload of calibrated frames
 # ---------------------------------------------------------------------------
 
+_thread_state = threading.local()
+
+
+def _session() -> requests.Session:
+    """Per-thread session, so each upload thread keeps its HTTPS connection open."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _thread_state.session = requests.Session()
+    return session
+
+
+def _upload_one(p: Path, headers: dict, data: dict) -> None:
+    try:
+        with p.open("rb") as f:
+            resp = _session().post(
+                UPLOAD_URL,
+                headers=headers,
+                data=data,
+                files={"files": f},
+                timeout=60,
+            )
+    except requests.RequestException as exc:
+        raise BHTOMUploadError(
+            f"Network error while uploading {p.name}: {exc}"
+        ) from exc
+
+    try:
+        payload = resp.json()
+    except Exception:
+        payload = {"raw": resp.text}
+
+    if resp.status_code != 200:
+        raise BHTOMUploadError(
+            f"Upload failed for {p.name}: HTTP {resp.status_code}, response={payload}"
+        )
+
+    # If API encodes logical errors inside JSON, we can add extra checks here
+    if isinstance(payload, dict) and "non_field_errors" in payload:
+        raise BHTOMUploadError(
+            f"Upload failed for {p.name}: {payload.get('non_field_errors')}"
+        )
+
+
 def upload_calibrated_files(
     files: List[Path],
     token: str,
     target: str,
     observatory: str,
     filter_name: str = "GaiaSP/any",
+    max_workers: int = UPLOAD_WORKERS,
 ) -> None:
     """
-    Upload a list of calibrated FITS files to BHTOM.
+    Upload a list of calibrated FITS files to BHTOM, up to *max_workers*
+    files at a time.
 
     This is a simplified uploader: it assumes the target already exists in BHTOM.
-    Raises BHTOMUploadError on first failure.
+    Raises BHTOMUploadError on first failure; files not yet started are skipped.
     """
     if not files:
         return
 
     headers = {"Authorization": f"Token {token}"}
+    data = {
+        "target": target,
+        "filter": filter_name,
+        "data_product_type": "fits_file",
+        "dry_run": "False",
+        "observatory": observatory,
+    }
+
+    if max_workers <= 1 or len(files) == 1:
+        for p in files:
+            _upload_one(p, headers, data)
+        return
 
-    for p in files:
-        data = {
-            "target": target,
-            "filter": filter_name,
-            "data_product_type": "fits_file",
-            "dry_run": "False",
-            "observatory": observatory,
-        }
-
-        try:
-            with p.open("rb") as f:
-                resp = requests.post(
-                    UPLOAD_URL,
-                    headers=headers,
-                    data=data,
-                    files={"files": f},
-                    timeout=60,
-                )
-        except requests.RequestException as exc:
-            raise BHTOMUploadError(
-                f"Network error while uploading {p.name}: {exc}"
-            ) from exc
-
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as pool:
+        futures = [pool.submit(_upload_one, p, headers, data) for p in files]
         try:
-            payload = resp.json()
-        except Exception:
-            payload = {"raw": resp.text}
-
-        if resp.status_code != 200:
-            raise BHTOMUploadError(
-                f"Upload failed for {p.name}: HTTP {resp.status_code}, response={payload}"
-            )
-
-        # If API encodes logical errors inside JSON, we can add extra checks here
-        if isinstance(payload, dict) and "non_field_errors" in payload:
-            raise BHTOMUploadError(
-                f"Upload failed for {p.name}: {payload.get('non_field_errors')}"
-            )
+            for fut in as_completed(futures):
+                fut.result()
+        except BaseException:
+            for fut in futures:
+                fut.cancel()
+            raise
 
 
 # ---------------------------------------------------------------------------
@@ -11,8 +11,10 @@ from astropy.io import fits
 
 try:
     from .calib_config import CalibConfig
+    from .calib_io import native_float32
 except ImportError:
     from calibration.calib_config import CalibConfig
+    from calibration.calib_io import native_float32
 
 
 def _read_list(list_path: Path) -> List[str]:
@@ -44,7 +46,7 @@ def apply_bias_correction(
         raise FileNotFoundError(f"Master bias file not found: {masterbias_path}")
 
     with fits.open(masterbias_path, memmap=False) as hdul:
-        mb_data = hdul[0].data.astype(np.float32)
+        mb_data = native_float32(hdul[0].data)
 
     image_type_key = cfg.get("HEADER_SPECIFICATION", "image_type_keyword", "IMAGETYP")
     bias_label = str(cfg.get("BIAS_SUBTRACTION", "bias_keyword", "BIAS")).strip().upper()
@@ -62,7 +64,7 @@ def apply_bias_correction(
         try:
             with fits.open(p, memmap=False) as hdul:
                 hdr = hdul[0].header
-                data = hdul[0].data.astype(np.float32)
+                data = native_float32(hdul[0].data)
 
             imagetyp = str(hdr.get(image_type_key, "")).strip().upper()
             if imagetyp == bias_label:
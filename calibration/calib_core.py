@@ -34,7 +34,12 @@ class CalibrationPipeline:
 
     FITS_EXTENSIONS = {".fits", ".fit", ".FITS", ".FIT"}
 
-    def __init__(self, config_path: str, root_dir: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        config_path: str,
+        root_dir: Optional[str] = None,
+        cfg: Optional[CalibConfig] = None,
+    ) -> None:
         """
         Parameters
         ----------
@@ -44,9 +49,11 @@ class CalibrationPipeline:
             If given, all DATA_STRUCTURE dirs (work/results/aux) are created
             INSIDE this directory, ignoring relative paths from the config.
             This is what the GUI uses: the selected raw directory.
+        cfg : CalibConfig, optional
+            Already-parsed config for *config_path*; read from disk if omitted.
         """
         self.config_path = str(config_path)
-        self.cfg = CalibConfig(self.config_path)
+        self.cfg = cfg if cfg is not None else CalibConfig(self.config_path)
         self.full_config = self.cfg.config
 
         self.root_dir: Optional[Path]
@@ -0,0 +1,127 @@
+# calibration/calib_io.py
+
+"""
+FITS pixel I/O helpers shared by the calibration steps.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+from astropy.io import fits
+
+# Frames are combined in bands of rows holding about this many bytes of
+# float32 stack, so memory no longer grows with the number of frames.
+BAND_BYTES = 64 * 1024 * 1024
+
+# gzip, bzip2, zip, xz: astropy decompresses these on open
+_COMPRESSED_MAGIC = (b"\x1f\x8b", b"BZh", b"PK\x03\x04", b"\xfd7zXZ")
+
+# on-disk (big-endian) pixel type of each BITPIX
+BITPIX_DTYPES = {8: "u1", 16: ">i2", 32: ">i4", 64: ">i8", -32: ">f4", -64: ">f8"}
+
+RowReader = Callable[[int, int], np.ndarray]
+
+
+def native_float32(data: np.ndarray) -> np.ndarray:
+    """Return FITS *data* as native float32, byteswapping >f4 in place."""
+    if data.dtype.kind == "f" and data.dtype.itemsize == 4 and not data.dtype.isnative:
+        return data.byteswap(inplace=True).view(data.dtype.newbyteorder("="))
+    return data.astype(np.float32, copy=False)
+
+
+def scale_rows(
+    raw: np.ndarray, bitpix: int, bzero: float, bscale: float, blank: Optional[int]
+) -> np.ndarray:
+    """Physical values of raw FITS pixels, computed the way astropy scales them."""
+    if bzero == 0 and bscale == 1 and blank is None:
+        return raw
+
+    bits = abs(bitpix)
+    if bitpix in (16, 32, 64) and bscale == 1 and bzero == 1 << (bits - 1):
+        # pseudo-unsigned integers (astropy's default uint=True)
+        udtype = np.dtype(f"uint{bits}")
+        data = np.array(raw, dtype=udtype)
+        data -= udtype.type(1 << (bits - 1))
+        return data
+
+    # integers scale to float32 up to 16 bits and float64 above; floats
+    # keep their width
+    if bitpix > 16 or bitpix == -64:
+        data = raw.astype(np.float64)
+    else:
+        data = raw.astype(np.float32)
+    if bscale != 1:
+        data *= bscale
+    if bzero != 0:
+        data += bzero
+    if blank:  # astropy skips BLANK = 0 as well
+        data[raw == blank] = np.nan
+    return data
+
+
+def is_compressed(fname: str) -> bool:
+    """True if *fname* is a gzip/bzip2/zip/xz file (whatever its suffix)."""
+    with open(fname, "rb") as f:
+        return f.read(6).startswith(_COMPRESSED_MAGIC)
+
+
+def _row_reader(fname: str) -> Tuple[Tuple[int, ...], RowReader]:
+    """Shape of the primary image of *fname* and a reader for its rows y0:y1."""
+    if is_compressed(fname):
+        # Sections of a compressed file decompress it from the start for
+        # every band, so these frames are read (and kept) whole.
+        data = fits.getdata(fname, 0)
+        return data.shape, lambda y0, y1: data[y0:y1]
+
+    # Header only: the pixels are read band by band below
+    with fits.open(fname, memmap=False, do_not_scale_image_data=True) as hdul:
+        hdr = hdul[0].header
+        shape = hdul[0].shape
+        offset = hdul.fileinfo(0)["datLoc"]
+
+    bitpix = int(hdr["BITPIX"])
+    bzero = hdr.get("BZERO", 0)
+    bscale = hdr.get("BSCALE", 1)
+    blank = hdr.get("BLANK") if bitpix > 0 else None
+    dtype = np.dtype(BITPIX_DTYPES[bitpix])
+    nx = shape[-1] if shape else 0
+
+    def read(y0: int, y1: int) -> np.ndarray:
+        # Opened per band, so only one input file is open at any time
+        with open(fname, "rb") as f:
+            f.seek(offset + y0 * nx * dtype.itemsize)
+            raw = np.fromfile(f, dtype=dtype, count=(y1 - y0) * nx)
+        return scale_rows(raw.reshape(y1 - y0, nx), bitpix, bzero, bscale, blank)
+
+    return shape, read
+
+
+def combine_in_bands(
+    files: List[str], combine: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """
+    Combine the primary images of *files* band by band: *combine* gets the
+    float32 (N, rows, nx) stack of one band and returns its (rows, nx) result.
+    Results are identical to combining the full stack for per-pixel combines.
+    """
+    readers = [_row_reader(fname) for fname in files]
+    shapes = {shape for shape, _ in readers}
+    if len(shapes) != 1:
+        raise ValueError(f"Frames differ in shape: {sorted(shapes)}")
+    shape = shapes.pop()
+    if len(shape) != 2:
+        raise ValueError(f"Expected 2D frames, got shape {shape}")
+    ny, nx = shape
+
+    rows = max(1, BAND_BYTES // (len(files) * nx * 4))
+    stack = np.empty((len(files), min(rows, ny), nx), dtype=np.float32)
+    out = np.empty((ny, nx), dtype=np.float32)
+    for y0 in range(0, ny, rows):
+        y1 = min(y0 + rows, ny)
+        band = stack[:, : y1 - y0]
+        for k, (_, read) in enumerate(readers):
+            band[k] = read(y0, y1)
+        out[y0:y1] = combine(band)
+    return out
@@ -11,8 +11,10 @@ from astropy.io import fits
 
 try:
     from .calib_config import CalibConfig
+    from .calib_io import native_float32
 except ImportError:
     from calibration.calib_config import CalibConfig
+    from calibration.calib_io import native_float32
 
 
 def _read_list(list_path: Path) -> List[str]:
@@ -46,7 +48,7 @@ def apply_dark_correction(
         raise FileNotFoundError(f"Master dark file not found: {md_path}")
 
     with fits.open(md_path, memmap=False) as hdul:
-        md_data = hdul[0].data.astype(np.float32)
+        md_data = native_float32(hdul[0].data)
 
     image_type_key = cfg.get("HEADER_SPECIFICATION", "image_type_keyword", "IMAGETYP")
     exposure_key = cfg.get("HEADER_SPECIFICATION", "exposure_keyword", "EXPTIME")
@@ -67,7 +69,7 @@ def apply_dark_correction(
         try:
             with fits.open(p, memmap=False) as hdul:
                 hdr = hdul[0].header
-                data = hdul[0].data.astype(np.float32)
+                data = native_float32(hdul[0].data)
 
             imagetyp = str(hdr.get(image_type_key, "")).strip().upper()
             if imagetyp in (bias_label, dark_label):
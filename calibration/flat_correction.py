@@ -11,8 +11,10 @@ from astropy.io import fits
 
 try:
     from .calib_config import CalibConfig
+    from .calib_io import native_float32
 except ImportError:
     from calibration.calib_config import CalibConfig
+    from calibration.calib_io import native_float32
 
 
 def _read_list(list_path: Path) -> List[str]:
@@ -71,7 +73,7 @@ def apply_flat_correction(
         try:
             with fits.open(p, memmap=False) as hdul:
                 hdr = hdul[0].header
-                data = hdul[0].data.astype(np.float32)
+                data = native_float32(hdul[0].data)
 
             imagetyp = str(hdr.get(image_type_key, "")).strip().upper()
             if imagetyp != "OBJECT":
@@ -103,7 +105,7 @@ def apply_flat_correction(
                 if verbose:
                     print(f"[flat_correction] Loading normalized masterflat for {filt}: {norm_flat_path}")
                 with fits.open(norm_flat_path, memmap=False) as fh:
-                    masterflat_cache[filt] = fh[0].data.astype(np.float32)
+                    masterflat_cache[filt] = native_float32(fh[0].data)
 
             norm_flat = masterflat_cache[filt]
             # avoid division by zero:
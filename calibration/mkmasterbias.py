@@ -15,8 +15,10 @@ import matplotlib.pyplot as plt
 
 try:
     from .calib_config import CalibConfig
+    from .calib_io import combine_in_bands
 except ImportError:
     from calibration.calib_config import CalibConfig
+    from calibration.calib_io import combine_in_bands
 
 
 def find_bias_frames(files: List[str], cfg: CalibConfig, verbose: bool = False) -> List[str]:
@@ -106,25 +108,21 @@ def create_master_bias(
     if verbose:
         print(f"[mkmasterbias] Combining {len(bias_files)} bias frames with {method_cfg}, sigma={sigma_cfg}")
 
-    stack_list = []
-    for fname in bias_files:
-        with fits.open(fname, memmap=False) as hdul:
-            data = hdul[0].data.astype(np.float32)
-            stack_list.append(data)
-
-    bias_stack = np.stack(stack_list, axis=0)
-
-    if method_cfg == "MedianSigmaClipped":
-        clipped = sigma_clip(bias_stack, sigma=sigma_cfg, axis=0)
-        master_bias = np.nanmedian(clipped, axis=0)
-    elif method_cfg.lower() in ("median", "med"):
-        master_bias = np.median(bias_stack, axis=0)
-    elif method_cfg.lower() in ("average", "mean"):
-        master_bias = np.mean(bias_stack, axis=0)
-    else:
+    def combine(bias_stack: np.ndarray) -> np.ndarray:
+        if method_cfg == "MedianSigmaClipped":
+            clipped = sigma_clip(bias_stack, sigma=sigma_cfg, axis=0)
+            return np.nanmedian(clipped, axis=0)
+        if method_cfg.lower() in ("average", "mean"):
+            return np.mean(bias_stack, axis=0)
+        return np.median(bias_stack, axis=0)
+
+    if method_cfg != "MedianSigmaClipped" and method_cfg.lower() not in (
+        "median", "med", "average", "mean"
+    ):
         if verbose:
             print(f"[mkmasterbias] Unsupported method '{method_cfg}', falling back to median.")
-        master_bias = np.median(bias_stack, axis=0)
+
+    master_bias = combine_in_bands(bias_files, combine)
 
     out_path = working_dir / output_filename
     hdu = fits.PrimaryHDU(master_bias.astype(np.float32))
@@ -14,8 +14,10 @@ import matplotlib.pyplot as plt
 
 try:
     from .calib_config import CalibConfig
+    from .calib_io import combine_in_bands
 except ImportError:
     from calibration.calib_config import CalibConfig
+    from calibration.calib_io import combine_in_bands
 
 
 def find_dark_frames(files: List[str], cfg: CalibConfig, verbose: bool = False) -> List[str]:
@@ -124,40 +126,37 @@ def make_master_dark(
 
     exptime_key = cfg.get("HEADER_SPECIFICATION", "exposure_keyword", "EXPTIME")
 
-    data_list = []
+    used_files = []
     exptime_list = []
 
+    # Headers only here; the pixels are read band by band below.
     for fname in dark_files:
-        with fits.open(fname, memmap=False) as hdul:
-            data = hdul[0].data.astype(np.float32)
-            exp = float(hdul[0].header.get(exptime_key, 0.0))
-            if exp <= 0:
-                if verbose:
-                    print(f"[mkmasterdark] Skipping {fname}: invalid exposure {exp}")
-                continue
-            data_list.append(data)
-            exptime_list.append(exp)
+        exp = float(fits.getheader(fname, 0).get(exptime_key, 0.0))
+        if exp <= 0:
+            if verbose:
+                print(f"[mkmasterdark] Skipping {fname}: invalid exposure {exp}")
+            continue
+        used_files.append(fname)
+        exptime_list.append(exp)
 
-    if not data_list:
+    if not used_files:
         raise RuntimeError("[mkmasterdark] No valid dark frames left after exposure checks.")
 
-    stack = np.stack(data_list, axis=0)
-    exptimes = np.array(exptime_list, dtype=np.float32)
-
-    if method_cfg == "ScaledExposureMedian":
-        scaled = stack / exptimes[:, None, None]
-        master_dark = np.median(scaled, axis=0)
-    elif method_cfg == "ScaledExposureAverage":
-        scaled = stack / exptimes[:, None, None]
-        master_dark = np.mean(scaled, axis=0)
-    elif method_cfg == "EqualExposure":
-        # assume same exposure, just median
-        master_dark = np.median(stack, axis=0)
-    else:
+    exptimes = np.array(exptime_list, dtype=np.float32)[:, None, None]
+
+    if method_cfg not in ("ScaledExposureMedian", "ScaledExposureAverage", "EqualExposure"):
         if verbose:
             print(f"[mkmasterdark] Unsupported method '{method_cfg}', falling back to ScaledExposureMedian.")
-        scaled = stack / exptimes[:, None, None]
-        master_dark = np.median(scaled, axis=0)
+
+    def combine(stack: np.ndarray) -> np.ndarray:
+        if method_cfg == "ScaledExposureAverage":
+            return np.mean(stack / exptimes, axis=0)
+        if method_cfg == "EqualExposure":
+            # assume same exposure, just median
+            return np.median(stack, axis=0)
+        return np.median(stack / exptimes, axis=0)
+
+    master_dark = combine_in_bands(used_files, combine)
 
     out_path = working_dir / output_filename
     hdu = fits.PrimaryHDU(master_dark.astype(np.float32))
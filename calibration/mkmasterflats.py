@@ -10,6 +10,16 @@ from typing import Dict, List, Tuple, Optional
 import numpy as np
 from astropy.io import fits
 
+try:
+    import fitsio  # optional: CFITSIO-backed reader, much faster header parsing
+except ImportError:
+    fitsio = None
+
+try:
+    from numba import njit, prange  # optional: JIT median for small stacks
+except ImportError:
+    njit = None
+
 try:
     from .calib_config import CalibConfig
 except ImportError:
@@ -38,11 +48,128 @@ def _get_filter_from_header(hdr, cfg: CalibConfig) -> str:
     return val if val in allowed else "UNKNOWN"
 
 
-def _normalize_flat(data: np.ndarray) -> np.ndarray:
+class _FitsioHeader:
+    """Thin wrapper so a fitsio header can be queried like an astropy one."""
+
+    def __init__(self, hdr, path: str) -> None:
+        self._hdr = hdr
+        self.path = path
+
+    def get(self, key, default=None):
+        return self._hdr.get(key, default)
+
+
+def _read_flat_header(fname: str):
+    """Header of the primary HDU of *fname*; no pixel data is read."""
+    if fitsio is not None:
+        return _FitsioHeader(fitsio.read_header(fname, 0), fname)
+    return fits.getheader(fname, 0)
+
+
+def _read_flat_data(fname: str) -> np.ndarray:
+    """
+    Float32 pixel data of the primary HDU of *fname*.
+
+    Uses fitsio when it is installed and falls back to astropy.io.fits
+    (always for integer frames with BLANK pixels).
+    """
+    if fitsio is not None:
+        data, hdr = fitsio.read(fname, 0, header=True)
+        # fitsio ignores BLANK; astropy below turns those pixels into NaN
+        if not (hdr.get("BLANK") and hdr["BITPIX"] > 0):
+            return data.astype(np.float32)
+
+    # Only HDU 0 is needed; getdata loads HDUs lazily and skips the rest.
+    # memmap is left at astropy's default: unscaled data is memory-mapped,
+    # BZERO/BSCALE frames (which cannot be mapped) are read normally.
+    return fits.getdata(fname, 0).astype(np.float32)
+
+
+def _astropy_header(hdr) -> fits.Header:
+    """Header suitable for writing with astropy (re-read if it came from fitsio)."""
+    if isinstance(hdr, _FitsioHeader):
+        return fits.getheader(hdr.path, 0)
+    return hdr
+
+
+# Above this many frames NumPy's introselect beats per-pixel insertion sort.
+_SMALL_STACK_MAX = 32
+
+# Set before the first launch of _small_stack_median, see _prefer_non_tbb_layer()
+_threading_layer_set = False
+
+if njit is not None:
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _small_stack_median(stack):
+        n, ny, nx = stack.shape
+        half = n // 2
+        out = np.empty((ny, nx), np.float32)
+        for i in prange(ny):
+            buf = np.empty(n, np.float32)
+            for j in range(nx):
+                has_nan = False
+                # insertion sort of the n samples of pixel (i, j)
+                for k in range(n):
+                    v = stack[k, i, j]
+                    if v != v:
+                        has_nan = True
+                    m = k - 1
+                    while m >= 0 and buf[m] > v:
+                        buf[m + 1] = buf[m]
+                        m -= 1
+                    buf[m + 1] = v
+                if has_nan:
+                    out[i, j] = np.nan
+                elif n % 2:
+                    out[i, j] = buf[half]
+                else:
+                    out[i, j] = 0.5 * (buf[half - 1] + buf[half])
+        return out
+
+
+def _prefer_non_tbb_layer() -> None:
+    """
+    Prefer numba's OpenMP/workqueue threading layers to TBB.
+
+    The GUI runs the kernel from Qt thread-pool threads; once TBB has been
+    started from such a thread the process never exits. numba picks the
+    layer at the first parallel launch, so this runs just before it rather
+    than at import, leaving numba alone for code that never calls the kernel.
+    """
+    global _threading_layer_set
+    if not _threading_layer_set:
+        from numba import config
+
+        config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+        _threading_layer_set = True
+
+
+def _median_stack(stack: np.ndarray, overwrite_input: bool = False) -> np.ndarray:
+    """
+    Median along axis 0 (frame axis) of a (N, ny, nx) stack.
+
+    With *overwrite_input* NumPy may partially sort *stack* in place
+    instead of working on a copy.
+    """
+    if (
+        njit is not None
+        and stack.dtype == np.float32
+        and stack.shape[0] <= _SMALL_STACK_MAX
+    ):
+        _prefer_non_tbb_layer()
+        return _small_stack_median(stack)
+    return np.median(stack, axis=0, overwrite_input=overwrite_input)
+
+
+def _normalize_flat(data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Divide *data* by its mean; pass ``out=data`` to normalize in place."""
     avg = float(np.mean(data))
     if avg == 0:
         return data
-    return data / avg
+    # one scalar division, then a float32 multiply over the whole frame
+    inv = np.float32(1.0 / avg)
+    return np.multiply(data, inv, out=out)
 
 
 def create_master_flats(
@@ -132,9 +259,8 @@ def create_master_flats(
                 print(f"[mkmasterflats] Skipping missing file: {fname}")
             continue
 
-        with fits.open(fname, memmap=False) as hdul:
-            hdr = hdul[0].header
-            data = hdul[0].data.astype(np.float32)
+        # Header-only pass first: non-flats never have their pixels read.
+        hdr = _read_flat_header(fname)
 
         imagetyp = str(hdr.get(image_type_key, "")).strip().upper()
         if imagetyp != "FLAT":
@@ -146,6 +272,8 @@ def create_master_flats(
                 print(f"[mkmasterflats] Skipping {fname}: unknown filter.")
             continue
 
+        data = _read_flat_data(fname)
+
         mean_val = float(np.mean(data))
         if mean_val < flat_min_value:
             if verbose:
@@ -183,19 +311,26 @@ def create_master_flats(
         if verbose:
             print(f"[mkmasterflats] Combining {len(stack_list)} flats for filter {filt}")
 
+        # A single (N, ny, nx) buffer serves both combines: the raw median
+        # first, then the same frames normalized in place.
         stack = np.stack(stack_list, axis=0)
-        median_flat = np.median(stack, axis=0)
+        stack_list.clear()
+        median_flat = _median_stack(stack)
 
-        norm_stack = np.stack([_normalize_flat(d) for d in stack_list], axis=0)
-        median_norm_flat = np.median(norm_stack, axis=0)
+        for frame in stack:
+            _normalize_flat(frame, out=frame)
+        median_norm_flat = _median_stack(stack, overwrite_input=True)
+        del stack
 
         flat_path = working_dir / f"masterflat_{filt}.fits"
         norm_flat_path = working_dir / f"masterflat_{filt}_norm.fits"
 
-        hdu = fits.PrimaryHDU(median_flat.astype(np.float32), header=header_by_filter[filt])
+        header = _astropy_header(header_by_filter[filt])
+
+        hdu = fits.PrimaryHDU(median_flat.astype(np.float32), header=header)
         hdu.writeto(flat_path, overwrite=True)
 
-        hdun = fits.PrimaryHDU(median_norm_flat.astype(np.float32), header=header_by_filter[filt])
+        hdun = fits.PrimaryHDU(median_norm_flat.astype(np.float32), header=header)
         hdun.writeto(norm_flat_path, overwrite=True)
 
         # copy to results/aux for possible library use
@@ -0,0 +1,64 @@
+# gui/_fastclim.py
+"""
+Optional numba kernel for the viewer's display stretch.
+
+Kept in its own module and always imported as ``gui._fastclim``: numba's
+on-disk cache records the defining module's name, and main_window is
+imported both as ``main_window`` (gui/main.py) and ``gui.main_window``.
+``histogram_clim`` is None when numba is not installed.
+
+The kernel is serial on purpose: frames are already loaded in parallel on
+the Qt thread pool, and numba's TBB threading layer, when launched from
+those threads, kept the interpreter from exiting.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+histogram_clim = None
+
+if njit is not None:
+
+    @njit(cache=True)
+    def histogram_clim(data, lo, hi, bins):
+        # Same bins and rank search as main_window._percentile_clim, but
+        # min/max and the histogram are native loops with no temporaries.
+        ny, nx = data.shape
+        vmin = np.inf
+        vmax = -np.inf
+        for i in range(ny):
+            for j in range(nx):
+                v = data[i, j]
+                if np.isfinite(v):
+                    if v < vmin:
+                        vmin = v
+                    if v > vmax:
+                        vmax = v
+        if vmin > vmax:
+            return 0.0, 1.0
+        if vmin == vmax:
+            # np.histogram widens an empty range the same way
+            vmin -= 0.5
+            vmax += 0.5
+        scale = bins / (vmax - vmin)
+
+        counts = np.zeros(bins, np.int64)
+        for i in range(ny):
+            for j in range(nx):
+                v = data[i, j]
+                if np.isfinite(v):
+                    k = int((v - vmin) * scale)
+                    if k >= bins:
+                        k = bins - 1
+                    counts[k] += 1
+        cdf = np.cumsum(counts)
+        i_lo = np.searchsorted(cdf, lo / 100.0 * cdf[-1])
+        i_hi = np.searchsorted(cdf, hi / 100.0 * cdf[-1])
+        width = (vmax - vmin) / bins
+        return vmin + i_lo * width, vmin + (i_hi + 1) * width
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QCursor
+from PySide6.QtGui import QImage, QPixmap, QCursor
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -25,6 +26,33 @@ from bhtom_api import get_auth_token, BHTOMAuthError
 
 ASSETS_DIR = Path(__file__).resolve().parent / "assets"
 
+# (file name, width, height) of every image the dialog shows
+_ASSET_SIZES = (
+    ("logo.png", 157, 157),
+    ("hidden.png", 16, 16),
+    ("visible.png", 16, 16),
+)
+
+
+@lru_cache(maxsize=None)
+def _load_icon(path: str, width: int, height: int) -> QImage:
+    """
+    Load *path* smooth-scaled to fit width x height (null image if missing).
+
+    Returns a QImage rather than a QPixmap so it can be decoded off the
+    GUI thread; convert with QPixmap.fromImage() where it is displayed.
+    """
+    image = QImage(path)
+    if image.isNull():
+        return image
+    return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def preload_assets() -> None:
+    """Decode and scale the dialog images ahead of the first dialog open."""
+    for name, width, height in _ASSET_SIZES:
+        _load_icon(str(ASSETS_DIR / name), width, height)
+
 
 class BHTOMLoginDialog(QDialog):
     """
@@ -63,11 +91,9 @@ class BHTOMLoginDialog(QDialog):
 
         # Top logo + title
         logo_label = QLabel()
-        logo_path = ASSETS_DIR / "logo.png"
-        if logo_path.exists():
-            pix = QPixmap(str(logo_path))
-            pix = pix.scaledToWidth(157, Qt.SmoothTransformation)
-            logo_label.setPixmap(pix)
+        logo_image = _load_icon(str(ASSETS_DIR / "logo.png"), 157, 157)
+        if not logo_image.isNull():
+            logo_label.setPixmap(QPixmap.fromImage(logo_image))
             logo_label.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
 
         title_label = QLabel("Welcome back")
@@ -114,21 +140,11 @@ class BHTOMLoginDialog(QDialog):
         self.toggle_pw_btn.setFocusPolicy(Qt.NoFocus)
         self.toggle_pw_btn.setStyleSheet("border: none; background: transparent;")
 
-        hidden_path = ASSETS_DIR / "hidden.png"
-        visible_path = ASSETS_DIR / "visible.png"
-        self._hidden_icon = (
-            QPixmap(str(hidden_path)).scaled(
-                16, 16, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            if hidden_path.exists()
-            else QPixmap()
+        self._hidden_icon = QPixmap.fromImage(
+            _load_icon(str(ASSETS_DIR / "hidden.png"), 16, 16)
         )
-        self._visible_icon = (
-            QPixmap(str(visible_path)).scaled(
-                16, 16, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            if visible_path.exists()
-            else QPixmap()
+        self._visible_icon = QPixmap.fromImage(
+            _load_icon(str(ASSETS_DIR / "visible.png"), 16, 16)
         )
         if not self._hidden_icon.isNull():
             self.toggle_pw_btn.setIcon(self._hidden_icon)
@@ -1,19 +1,25 @@
 # gui/main_window.py
 from __future__ import annotations
 
+import gc
+import importlib
+import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 
 import numpy as np
 from astropy.io import fits
+from matplotlib import colormaps
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
+from matplotlib.colors import NoNorm
 from matplotlib.figure import Figure
 
-from PySide6.QtCore import Qt, QTimer, Slot
-from PySide6.QtGui import QAction
+from PySide6.QtCore import Qt, QThreadPool, QTimer, Slot
+from PySide6.QtGui import QAction, QCloseEvent
 from PySide6.QtWidgets import (
-    QApplication,
     QMainWindow,
     QWidget,
     QFileDialog,
@@ -34,21 +40,235 @@ from PySide6.QtWidgets import (
     QInputDialog,
 )
 
+try:
+    import fitsio  # optional: CFITSIO-backed reader, faster than astropy
+except ImportError:
+    fitsio = None
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 CONFIG_DIR = ROOT_DIR / "configs"
 
+COORDS_EMPTY = "x: –, y: –, I: –"
+# Pixel readout is refreshed at most this often (~30 Hz) while hovering
+COORDS_INTERVAL_MS = 33
+
+# Colormaps offered by the viewer. Looked up once and shared by every
+# canvas: the registry hands out a fresh copy (and LUT) on each lookup.
+VIEWER_CMAPS = ("gray", "viridis", "magma", "plasma")
+_COLORMAPS = {name: colormaps[name] for name in VIEWER_CMAPS}
+
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from calibration.calib_config import CalibConfig  # noqa: E402
+from calibration.calib_io import BITPIX_DTYPES, is_compressed, scale_rows  # noqa: E402
 import bhtom_api  # noqa: E402
-from calibration.calib_core import CalibrationPipeline  # noqa: E402
-from gui.bhtom_login_dialog import BHTOMLoginDialog  # noqa: E402
+from gui.bhtom_login_dialog import BHTOMLoginDialog, preload_assets  # noqa: E402
+from gui.worker import Worker  # noqa: E402
+from gui._fastclim import histogram_clim  # noqa: E402
 
 
 # ----------------------------------------------------------------------
 # Matplotlib-based FITS viewer
 # ----------------------------------------------------------------------
+def _percentile_clim(
+    data: np.ndarray, lo: float = 2.0, hi: float = 98.0, bins: int = 4096
+) -> tuple[float, float]:
+    """
+    Approximate (lo, hi) percentiles of *data* for the display stretch.
+
+    One histogram pass replaces np.percentile's partial sort; the result
+    is accurate to one bin (1/4096 of the data range). NaN/inf are ignored.
+
+    A single np.partition on both ranks was measured as the alternative and
+    is 1.1–2.2x slower from 256² to 4096² float32 frames, since it must copy
+    the frame and select in place; the histogram only streams over it.
+    With numba installed, native 2D frames take gui._fastclim.
+    """
+    if (
+        histogram_clim is not None
+        and data.ndim == 2
+        and data.dtype.kind in "fiu"
+        and data.dtype.isnative
+    ):
+        vmin, vmax = histogram_clim(data, float(lo), float(hi), bins)
+        return float(vmin), float(vmax)
+
+    vmin, vmax = float(np.nanmin(data)), float(np.nanmax(data))
+    if not (np.isfinite(vmin) and np.isfinite(vmax)):
+        data = data[np.isfinite(data)]
+        if data.size == 0:
+            return 0.0, 1.0
+        vmin, vmax = float(data.min()), float(data.max())
+
+    counts, edges = np.histogram(data, bins=bins, range=(vmin, vmax))
+    cdf = np.cumsum(counts)
+    i_lo, i_hi = np.searchsorted(cdf, np.array([lo, hi]) / 100.0 * cdf[-1])
+    return float(edges[i_lo]), float(edges[i_hi + 1])
+
+
+# Raw-directory suffixes picked up by "Create master frames" (lowercased match)
+_FITS_EXTS = (".fits", ".fit")
+_FITS_DIALOG_FILTER = "FITS files (*.fits *.fit);;All files (*)"
+
+
+def _iter_files(directory: str | Path, suffixes: tuple[str, ...], contains: str = ""):
+    """
+    Yield paths of regular files in *directory* whose lowercased name ends
+    with one of *suffixes* and contains *contains*. One scandir pass; the
+    DirEntry type check reuses the readdir result, so there is no stat per file.
+    """
+    with os.scandir(directory) as it:
+        for e in it:
+            name = e.name.lower()
+            if name.endswith(suffixes) and contains in name and e.is_file():
+                yield e.path
+
+
+# Frames larger than this (in either axis) are decimated for display to
+# roughly the canvas size in device pixels (DISPLAY_TARGET_PX while the
+# canvas has no size yet); the full array is kept for readout.
+DISPLAY_MAX_PX = 2048
+DISPLAY_TARGET_PX = 1024
+
+
+# Frames whose float32 pixels exceed this are memory-mapped instead of
+# being read into RAM; conversions of such frames go in slabs of SLAB_BYTES.
+# 8/16-bit integer frames are kept in their stored type (half or a quarter
+# of a float32 copy); every other type is shown as float32.
+MEMMAP_MIN_BYTES = 256 * 1024 * 1024
+SLAB_BYTES = 4 * 1024 * 1024
+
+# Buffer for the astropy read path: one open and one large read per file
+# instead of astropy reopening the path and reading in 8 KiB pieces.
+READ_BUFFER_BYTES = 1024 * 1024
+
+
+def _viewer_dtype(arr: np.ndarray) -> np.ndarray:
+    """Native-endian *arr*; 8/16-bit integers stay as they are, the rest float32."""
+    if arr.dtype.kind in "iu" and arr.dtype.itemsize <= 2:
+        return arr.astype(arr.dtype.newbyteorder("="), copy=False)
+    return arr.astype(np.float32, copy=False)
+
+
+def _memmap_fits_image(path: str | Path) -> Optional[np.ndarray]:
+    """
+    Memory-map the first image HDU of a very large FITS file.
+
+    Unscaled float32 and 8/16-bit integer data is mapped straight from the
+    file (big-endian, read-only). Other types are converted to float32 slab
+    by slab into an unlinked temporary file, so resident memory stays near
+    one slab either way.
+    Returns None when the file is small or cannot be mapped (compressed,
+    tile-compressed, not 2D); the caller then reads it normally.
+    """
+    path = str(path)
+    # An 8-bit file is the smallest one that can reach MEMMAP_MIN_BYTES as float32
+    if os.path.getsize(path) < MEMMAP_MIN_BYTES // 4 or is_compressed(path):
+        return None
+
+    with fits.open(path) as hdul:
+        hdu = next(
+            (h for h in hdul if h.is_image and h.header.get("NAXIS", 0) > 0), None
+        )
+        if hdu is None or isinstance(hdu, fits.CompImageHDU) or len(hdu.shape) != 2:
+            return None
+        hdr = hdu.header
+        shape = hdu.shape
+        offset = hdu.fileinfo()["datLoc"]
+
+    if shape[0] * shape[1] * 4 < MEMMAP_MIN_BYTES:
+        return None
+
+    bitpix = hdr["BITPIX"]
+    bscale = hdr.get("BSCALE", 1)
+    bzero = hdr.get("BZERO", 0)
+    blank = hdr.get("BLANK") if bitpix > 0 else None
+
+    raw = np.memmap(path, dtype=BITPIX_DTYPES[bitpix], mode="r", offset=offset, shape=shape)
+    if bitpix in (-32, 8, 16) and bscale == 1 and bzero == 0 and blank is None:
+        return raw
+
+    out = np.memmap(tempfile.TemporaryFile(), dtype=np.float32, mode="w+", shape=shape)
+    rows = max(1, SLAB_BYTES // (shape[1] * 4))
+    for r0 in range(0, shape[0], rows):
+        # scaled as astropy would, then stored as float32
+        out[r0 : r0 + rows] = scale_rows(raw[r0 : r0 + rows], bitpix, bzero, bscale, blank)
+    return out
+
+
+def _read_fits_image(path: str | Path) -> np.ndarray:
+    """
+    Read the first image HDU of *path* (fitsio if installed), converted
+    with _viewer_dtype(): a 16-bit frame is not widened to float32.
+
+    Very large frames come back as a memory-mapped array, see
+    _memmap_fits_image().
+    """
+    mapped = _memmap_fits_image(path)
+    if mapped is not None:
+        return mapped
+    if fitsio is not None:
+        data, hdr = fitsio.read(str(path), header=True)
+        # fitsio ignores BLANK; astropy below turns those pixels into NaN
+        if not (hdr.get("BLANK") and hdr["BITPIX"] > 0):
+            return _viewer_dtype(data)
+    with open(path, "rb", buffering=READ_BUFFER_BYTES) as f:
+        return _viewer_dtype(fits.getdata(f))
+
+
+class LoadedFrame(NamedTuple):
+    path: Path
+    data: np.ndarray  # full resolution, used for pixel-value readout
+    clim: tuple[float, float]  # 2–98 % limits *display* is stretched to
+    display: np.ndarray  # data[::step, ::step] as 0–255 levels; imshow renders it
+    step: int
+
+
+def _display_levels(display: np.ndarray, vmin: float, vmax: float) -> np.ndarray:
+    """
+    Stretch *display* to uint8 colormap indices, binned exactly as
+    matplotlib maps [vmin, vmax] onto a 256-entry colormap (values outside
+    clip to the ends). Non-finite pixels become 0.
+    """
+    scale = 256.0 / (vmax - vmin) if vmax > vmin else 0.0
+    levels = np.subtract(display, vmin, dtype=np.float32)
+    levels *= scale
+    np.clip(levels, 0, 255, out=levels)
+    np.nan_to_num(levels, copy=False)
+    return levels.astype(np.uint8)
+
+
+def _make_frame(
+    path: Path, data: np.ndarray, target_px: int = DISPLAY_TARGET_PX
+) -> LoadedFrame:
+    """Precompute everything the viewer needs to show *data* repeatedly."""
+    step = 1
+    if max(data.shape) > DISPLAY_MAX_PX:
+        step = max(1, max(data.shape) // target_px)
+    # A mapped frame is big-endian; the decimated copy is byteswapped once
+    # here so the stretch below runs on native data.
+    display = np.ascontiguousarray(
+        data[::step, ::step], dtype=data.dtype.newbyteorder("=")
+    )
+    # The decimated copy is an even-sampled subset of the frame: its 2–98 %
+    # stretch matches the full frame's, at 1/step² of the cost, and a
+    # memory-mapped frame is not read end to end just for its limits.
+    clim = _percentile_clim(display)
+    # The stretch is fixed per frame, so it is applied once here; each
+    # redraw then resamples a quarter of the float32 bytes and indexes the
+    # colormap directly instead of normalizing every pixel again.
+    return LoadedFrame(path, data, clim, _display_levels(display, *clim), step)
+
+
+def _load_frame(path: str, target_px: int = DISPLAY_TARGET_PX) -> LoadedFrame:
+    """Read *path* and prepare it for display (runs in a worker thread)."""
+    arr = _read_fits_image(path)
+    if arr.ndim != 2:
+        raise ValueError("Only 2D images are supported")
+    return _make_frame(Path(path), arr, target_px)
+
+
 class FitsCanvas(FigureCanvasQTAgg):
     def __init__(self, parent: QWidget | None = None) -> None:
         self.fig = Figure()
@@ -56,62 +276,150 @@ class FitsCanvas(FigureCanvasQTAgg):
         super().__init__(self.fig)
         self.setParent(parent)
 
-        self._image = None
         self._data: Optional[np.ndarray] = None
+        self._shape = (0, 0)  # self._data.shape, read on every motion event
         self._cmap = "gray"
-
-        self.fig.tight_layout()
-        self.mpl_connect("motion_notify_event", self._on_motion)
-
-        self.coord_callback = None  # type: ignore[assignment]
-
-    # Called by MainWindow
-    def show_fits(self, data: np.ndarray) -> None:
-        self.ax.clear()
-        self._data = data
-
-        # Stretch using 2–98 percentile for something DS9-like
-        vmin, vmax = np.percentile(data, (2, 98))
+        # pixel under the cursor (None = outside the image); (-1, -1) forces
+        # the next motion event to report
+        self._last_xy: Optional[tuple[int, int]] = (-1, -1)
+        # Readout throttle: the first move reports at once and starts the
+        # timer; moves while it runs only mark the readout dirty, and the
+        # timeout reports the latest pixel.
+        self._coords_dirty = False
+        self._coord_timer = QTimer(self)
+        self._coord_timer.setSingleShot(True)
+        self._coord_timer.setInterval(COORDS_INTERVAL_MS)
+        self._coord_timer.timeout.connect(self._on_coord_timer)
+
+        # One AxesImage for the canvas lifetime; show_fits only swaps its
+        # pixels/extent. Ticks stay off, so the axes simply fill the figure.
+        # With nearest sampling, resampling the data before colormapping is
+        # pixel-identical to the "auto" stage (which colormaps every pixel of
+        # a downsampled frame first) and several times cheaper per redraw.
+        # The pixels are 0–255 levels from _display_levels, used as colormap
+        # indices as they are (NoNorm).
         self._image = self.ax.imshow(
-            data,
+            np.zeros((1, 1), dtype=np.uint8),
             origin="lower",
-            cmap=self._cmap,
-            vmin=vmin,
-            vmax=vmax,
+            cmap=_COLORMAPS[self._cmap],
+            norm=NoNorm(),
             interpolation="nearest",
+            interpolation_stage="data",
+            visible=False,
         )
         self.ax.set_xticks([])
         self.ax.set_yticks([])
-        self.fig.tight_layout()
-        self.draw()
+        self.fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+        self.mpl_connect("motion_notify_event", self._on_motion)
+
+        self.coord_callback = None  # type: ignore[assignment]
+
+    # Called by MainWindow
+    def show_fits(
+        self,
+        data: np.ndarray,
+        display: Optional[np.ndarray] = None,
+        step: int = 1,
+    ) -> None:
+        """
+        Show *data*. If *display* is given it is rendered instead: the
+        _display_levels of data[::step, ::step]; axes coordinates stay
+        full-resolution pixels.
+        """
+        if display is None:
+            # Stretch using 2–98 percentile for something DS9-like
+            display, step = _display_levels(data, *_percentile_clim(data)), 1
+
+        self._last_xy = (-1, -1)
+        self._coords_dirty = False
+
+        # Same-shaped frame (e.g. blink) keeps the current zoom; a new shape
+        # gets its extent and the view reset to the whole image.
+        same_shape = (
+            self._data is not None
+            and self._data.shape == data.shape
+            and self._image.get_array().shape == display.shape
+        )
+        self._data = data
+        self._shape = data.shape
+        self._image.set_data(display)
+        if not same_shape:
+            # display[i, j] is data[i * step, j * step]: each sample gets a
+            # step-wide cell centred on that pixel. The view itself is the
+            # real frame, so the edge cells' overhang (< step / 2) stays out.
+            ny, nx = display.shape
+            half = 0.5 * step
+            self._image.set_extent((-half, nx * step - half, -half, ny * step - half))
+            self.ax.relim()  # drop the previous shape's data limits
+            self._set_frame_limits()
+            self._image.set_visible(True)
+        self.draw_idle()
 
     def set_cmap(self, cmap: str) -> None:
+        if cmap == self._cmap:
+            return
         self._cmap = cmap
-        if self._image is not None:
-            self._image.set_cmap(cmap)
+        self._image.set_cmap(_COLORMAPS.get(cmap, cmap))
+        if self._data is not None:
             self.draw_idle()
 
     def zoom_to_fit(self) -> None:
-        self.ax.autoscale(True)
-        self.fig.tight_layout()
-        self.draw_idle()
+        if self._data is None:
+            return
+        limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        self._set_frame_limits()
+        if (self.ax.get_xlim(), self.ax.get_ylim()) != limits:
+            self.draw_idle()
+
+    def _set_frame_limits(self) -> None:
+        """View the whole frame: pixel centres 0..n-1, edges at ±0.5."""
+        h, w = self._shape
+        self.ax.set_xlim(-0.5, w - 0.5)
+        self.ax.set_ylim(-0.5, h - 0.5)
+
+    def display_px(self) -> int:
+        """Longer side of the canvas in device pixels, for display decimation."""
+        if not self.isVisible():
+            return DISPLAY_TARGET_PX
+        side = max(self.width(), self.height()) * self.devicePixelRatioF()
+        return max(1, round(side))
 
     # Internal: mouse move -> pixel value
     def _on_motion(self, event) -> None:
-        if self._data is None or event.inaxes != self.ax:
-            if self.coord_callback:
-                self.coord_callback(None, None, None)
+        if self._data is None or event.inaxes is not self.ax:
+            xy = None
+        else:
+            # bounds are checked before truncating, so int() is a floor here
+            fx = event.xdata + 0.5
+            fy = event.ydata + 0.5
+            h, w = self._shape
+            xy = (int(fx), int(fy)) if 0.0 <= fx < w and 0.0 <= fy < h else None
+
+        # Most motion events stay on the same pixel: nothing to update
+        if xy == self._last_xy:
             return
+        self._last_xy = xy
 
-        x = int(round(event.xdata))
-        y = int(round(event.ydata))
-        if 0 <= y < self._data.shape[0] and 0 <= x < self._data.shape[1]:
-            value = float(self._data[y, x])
-            if self.coord_callback:
-                self.coord_callback(x, y, value)
+        if self._coord_timer.isActive():
+            self._coords_dirty = True
         else:
-            if self.coord_callback:
-                self.coord_callback(None, None, None)
+            self._report_coords()
+            self._coord_timer.start()
+
+    def _on_coord_timer(self) -> None:
+        if self._coords_dirty:
+            self._report_coords()
+            self._coord_timer.start()
+
+    def _report_coords(self) -> None:
+        self._coords_dirty = False
+        xy = self._last_xy
+        if not self.coord_callback:
+            return
+        if xy is None:
+            self.coord_callback(None, None, None)
+        else:
+            self.coord_callback(xy[0], xy[1], float(self._data[xy[1], xy[0]]))
 
 
 # ----------------------------------------------------------------------
@@ -126,10 +434,30 @@ class MainWindow(QMainWindow):
 
         self.current_config_path: Optional[Path] = None
         self.current_config: Optional[CalibConfig] = None
+        # Parsed profiles keyed by path, with the file's mtime when parsed
+        self._config_cache: dict[Path, tuple[int, CalibConfig]] = {}
 
-        self.loaded_frames: List[tuple[Path, np.ndarray]] = []
+        # Display limits and the decimated display copy are computed once at load
+        self.loaded_frames: List[LoadedFrame] = []
         self.current_frame_index: int = 0
+
+        # Background loading: one slot per selected file (kept in selection
+        # order); results from an older batch are ignored.
+        self._load_batch: int = 0
+        self._frame_slots: List[Optional[LoadedFrame]] = []
+        # loads of the current batch still running, and why others failed;
+        # failures are reported together once the batch is done
+        self._load_pending: int = 0
+        self._load_errors: List[str] = []
+
+        # Workers handed to QThreadPool; PySide drops the signals of a
+        # runnable whose Python object is collected, so hold them until done.
+        self._workers: set[Worker] = set()
+
+        # Single-shot and re-armed after each frame is shown, so a slow
+        # redraw delays the next tick instead of queueing more of them.
         self.blink_timer = QTimer(self)
+        self.blink_timer.setSingleShot(True)
         self.blink_timer.setInterval(500)
         self.blink_timer.timeout.connect(self._on_blink_timer)
 
@@ -143,7 +471,9 @@ class MainWindow(QMainWindow):
         self.last_bhtom_filter: Optional[str] = None
 
         # List of fully calibrated science frames (-bdf) for potential upload
-        self.calibrated_files: List[Path] = []
+        self.calibrated_files: List[str] = []  # Path only at the upload boundary
+        # True while an upload worker runs; keeps the upload button disabled
+        self._uploading = False
 
         self._create_actions()
         self._create_menu_and_toolbar()
@@ -160,6 +490,20 @@ class MainWindow(QMainWindow):
         # Initialize BHTOM UI (button text + status label + upload enabled/disabled)
         self._refresh_bhtom_ui()
 
+        # Decode the login dialog images in the background so its first
+        # open doesn't stall the UI thread.
+        self._start_worker(Worker(preload_assets))
+        # The pipeline is imported where it is used (astropy.convolution
+        # makes it the slowest import here); load it now, off the UI thread,
+        # so the first calibration run doesn't wait for it either.
+        self._start_worker(Worker(importlib.import_module, "calibration.calib_core"))
+
+    def _start_worker(self, worker: Worker) -> None:
+        """Run *worker* on the global thread pool, keeping it alive until done."""
+        self._workers.add(worker)
+        worker.signals.finished.connect(lambda w=worker: self._workers.discard(w))
+        QThreadPool.globalInstance().start(worker)
+
     # ------------------------------------------------------------------
     # UI construction
     # ------------------------------------------------------------------
@@ -187,7 +531,7 @@ class MainWindow(QMainWindow):
         sb = QStatusBar()
         self.setStatusBar(sb)
         self.lbl_status = QLabel("Ready")
-        self.lbl_coords = QLabel("x: –, y: –, I: –")
+        self.lbl_coords = QLabel(COORDS_EMPTY)
         sb.addWidget(self.lbl_status)
         sb.addPermanentWidget(self.lbl_coords)
 
@@ -227,7 +571,7 @@ class MainWindow(QMainWindow):
         self.btn_blink.stateChanged.connect(self._toggle_blink)
 
         self.cmb_cmap = QComboBox()
-        self.cmb_cmap.addItems(["gray", "viridis", "magma", "plasma"])
+        self.cmb_cmap.addItems(VIEWER_CMAPS)
         self.cmb_cmap.setCurrentText("gray")
         self.cmb_cmap.currentTextChanged.connect(self.canvas.set_cmap)
 
@@ -291,21 +635,21 @@ class MainWindow(QMainWindow):
         form.addRow("Raw data directory:", h)
 
         # Buttons
-        btn_prepare = QPushButton("1. Prepare file lists")
-        btn_prepare.setProperty("variant", "secondary")
-        btn_prepare.clicked.connect(self._run_prepare_lists)
+        self.btn_prepare = QPushButton("1. Prepare file lists")
+        self.btn_prepare.setProperty("variant", "secondary")
+        self.btn_prepare.clicked.connect(self._run_prepare_lists)
 
-        btn_masters = QPushButton("2. Create master frames")
-        btn_masters.setProperty("variant", "secondary")
-        btn_masters.clicked.connect(self._run_create_masters)
+        self.btn_masters = QPushButton("2. Create master frames")
+        self.btn_masters.setProperty("variant", "secondary")
+        self.btn_masters.clicked.connect(self._run_create_masters)
 
-        btn_full = QPushButton("3. Run full calibration")
-        btn_full.clicked.connect(self._run_full_calibration)
+        self.btn_full = QPushButton("3. Run full calibration")
+        self.btn_full.clicked.connect(self._run_full_calibration)
 
         layout.addWidget(box_run)
-        layout.addWidget(btn_prepare)
-        layout.addWidget(btn_masters)
-        layout.addWidget(btn_full)
+        layout.addWidget(self.btn_prepare)
+        layout.addWidget(self.btn_masters)
+        layout.addWidget(self.btn_full)
         layout.addStretch()
 
         return w
@@ -392,13 +736,19 @@ class MainWindow(QMainWindow):
             self.lbl_bhtom_status.setText(
                 f"Connected as {self.bhtom_username or 'unknown'}"
             )
-            if self.calibrated_files:
-                self.btn_upload_calibrated.setEnabled(True)
         else:
             self.btn_bhtom_connect.setText("Connect to BHTOM…")
             if not self.bhtom_username:
                 self.lbl_bhtom_status.setText("Not connected")
-            self.btn_upload_calibrated.setEnabled(False)
+        self._update_upload_button()
+
+    def _update_upload_button(self) -> None:
+        """Upload needs calibrated frames, a session and no upload running."""
+        self.btn_upload_calibrated.setEnabled(
+            bool(self.calibrated_files)
+            and self.bhtom_token is not None
+            and not self._uploading
+        )
 
     def _on_bhtom_connect_or_logout(self) -> None:
         if self.bhtom_token:
@@ -429,7 +779,7 @@ class MainWindow(QMainWindow):
         self.cmb_config.clear()
 
         if CONFIG_DIR.exists():
-            ini_files = sorted(CONFIG_DIR.glob("*.ini"))
+            ini_files = [Path(p) for p in sorted(_iter_files(CONFIG_DIR, (".ini",)))]
         else:
             ini_files = []
 
@@ -453,10 +803,35 @@ class MainWindow(QMainWindow):
             self.current_config = None
             return
 
-        self.current_config_path = path
-        self.current_config = CalibConfig(str(path))
+        try:
+            cfg = self._load_config(path)
+        except OSError as e:
+            self.current_config_path = None
+            self.current_config = None
+            QMessageBox.warning(self, "Config", f"Cannot read {path.name}:\n{e}")
+            return
+        if path == self.current_config_path and cfg is self.current_config:
+            return
+        self._set_config(path, cfg)
 
-        cfg = self.current_config
+    def _load_config(self, path: Path) -> CalibConfig:
+        """Parsed profile at *path*; re-parsed only if new or edited on disk."""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            # deleted or renamed since the profile list was built
+            self._config_cache.pop(path, None)
+            raise
+        cached = self._config_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        cfg = CalibConfig(str(path))
+        self._config_cache[path] = (mtime, cfg)
+        return cfg
+
+    def _set_config(self, path: Path, cfg: CalibConfig) -> None:
+        self.current_config_path = path
+        self.current_config = cfg
 
         self.lbl_obs_name.setText(str(cfg.get("GENERAL", "observatory_name")))
         self.lbl_telescope.setText(str(cfg.get("GENERAL", "telescope")))
@@ -476,35 +851,105 @@ class MainWindow(QMainWindow):
             self,
             "Open FITS files",
             "",
-            "FITS files (*.fits *.fit);;All files (*)",
+            _FITS_DIALOG_FILTER,
         )
-        if not paths:
+        if paths:
+            self._load_files(paths)
+
+    def _load_files(self, paths: List[str]) -> None:
+        """Replace the viewer's frames with *paths*, read in the background."""
+        # Read all files concurrently on the global thread pool; the first
+        # frame to arrive is shown right away, the rest fill in behind it.
+        self._release_frames()
+        batch = self._load_batch
+        self._frame_slots = [None] * len(paths)
+        self._load_pending = len(paths)
+        self.lbl_status.setText(f"Loading {len(paths)} FITS file(s)…")
+        # every frame of a batch uses the same stride, so blink keeps the view
+        target_px = self.canvas.display_px()
+
+        for slot, p in enumerate(paths):
+            worker = Worker(_load_frame, p, target_px)
+            worker.signals.result.connect(
+                lambda frame, b=batch, i=slot: self._on_frame_loaded(b, i, frame)
+            )
+            worker.signals.error.connect(
+                lambda tb, text, b=batch, p=p: self._on_frame_failed(b, p, text)
+            )
+            self._start_worker(worker)
+
+    def _on_frame_loaded(self, batch: int, slot: int, frame: LoadedFrame) -> None:
+        if batch != self._load_batch:
             return
+        shown = self.loaded_frames[self.current_frame_index] if self.loaded_frames else None
 
-        self.loaded_frames.clear()
-        for p in paths:
-            try:
-                arr = fits.getdata(p).astype(np.float32)
-                if arr.ndim != 2:
-                    raise ValueError("Only 2D images are supported")
-                self.loaded_frames.append((Path(p), arr))
-            except Exception as e:  # noqa: BLE001
-                QMessageBox.warning(self, "FITS error", f"Could not open {p}:\n{e}")
+        self._frame_slots[slot] = frame
+        self.loaded_frames = [f for f in self._frame_slots if f is not None]
 
-        if not self.loaded_frames:
+        if shown is None:
+            self.current_frame_index = 0
+            self._show_current_frame()
+        else:
+            # keep pointing at the frame on screen when earlier slots fill in
+            self.current_frame_index = next(
+                i for i, f in enumerate(self.loaded_frames) if f is shown
+            )
+            self.lbl_status.setText(self._frame_status_text())
+        # a blink tick during the reload found no frames and did not re-arm
+        if (
+            self.btn_blink.isChecked()
+            and len(self.loaded_frames) > 1
+            and not self.blink_timer.isActive()
+        ):
+            self.blink_timer.start()
+        self._on_frame_load_done()
+
+    def _on_frame_failed(self, batch: int, path: str, text: str) -> None:
+        if batch != self._load_batch:
             return
+        self._load_errors.append(f"{path}:\n{text}")
+        self._on_frame_load_done()
 
+    def _on_frame_load_done(self) -> None:
+        self._load_pending -= 1
+        if self._load_pending or not self._load_errors:
+            return
+        errors, self._load_errors = self._load_errors, []
+        if not self.loaded_frames:
+            self.lbl_status.setText("No FITS files could be opened")
+        QMessageBox.warning(
+            self,
+            "FITS error",
+            f"Could not open {len(errors)} file(s):\n\n" + "\n\n".join(errors),
+        )
+
+    def _release_frames(self) -> None:
+        """Drop all loaded frames and ignore loads still in flight."""
+        self._load_batch += 1
+        self._frame_slots = []
+        self._load_pending = 0
+        self._load_errors = []
+        self.loaded_frames = []
         self.current_frame_index = 0
-        self._show_current_frame()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self.blink_timer.stop()
+        self._release_frames()
+        # matplotlib artists form reference cycles; collect them (and the
+        # memmaps they still point at) now rather than at interpreter exit
+        gc.collect()
+        super().closeEvent(event)
+
+    def _frame_status_text(self) -> str:
+        return f"Showing frame {self.current_frame_index + 1}/{len(self.loaded_frames)}"
 
     def _show_current_frame(self) -> None:
-        path, data = self.loaded_frames[self.current_frame_index]
-        self.canvas.show_fits(data)
+        frame = self.loaded_frames[self.current_frame_index]
+        path, data = frame.path, frame.data
+        self.canvas.show_fits(data, display=frame.display, step=frame.step)
         self.lbl_file.setText(path.name)
         self.lbl_dim.setText(f"{data.shape[1]} × {data.shape[0]}")
-        self.lbl_status.setText(
-            f"Showing frame {self.current_frame_index + 1}/{len(self.loaded_frames)}"
-        )
+        self.lbl_status.setText(self._frame_status_text())
 
     def _on_blink_timer(self) -> None:
         if not self.loaded_frames:
@@ -513,9 +958,12 @@ class MainWindow(QMainWindow):
             self.loaded_frames
         )
         self._show_current_frame()
+        if self.btn_blink.isChecked():
+            self.blink_timer.start()
 
     def _toggle_blink(self, state: int) -> None:
-        if state == Qt.Checked and len(self.loaded_frames) > 1:
+        # stateChanged delivers a plain int, which never equals Qt.Checked
+        if self.btn_blink.isChecked() and len(self.loaded_frames) > 1:
             self.blink_timer.start()
         else:
             self.blink_timer.stop()
@@ -524,7 +972,7 @@ class MainWindow(QMainWindow):
         self, x: Optional[int], y: Optional[int], val: Optional[float]
     ) -> None:
         if x is None or y is None or val is None:
-            self.lbl_coords.setText("x: –, y: –, I: –")
+            self.lbl_coords.setText(COORDS_EMPTY)
         else:
             self.lbl_coords.setText(f"x: {x}, y: {y}, I: {val:.2f}")
 
@@ -540,13 +988,13 @@ class MainWindow(QMainWindow):
                 "Please select a directory with raw FITS files.",
             )
             return None
-        path = Path(text)
+        path = Path(text).expanduser()
         if not path.is_dir():
             QMessageBox.warning(
                 self, "Input directory", f"'{path}' is not a directory."
             )
             return None
-        return path
+        return path.resolve()
 
     def _browse_input_dir(self) -> None:
         dir_path = QFileDialog.getExistingDirectory(
@@ -564,7 +1012,18 @@ class MainWindow(QMainWindow):
         input_dir = self._get_input_dir()
         if input_dir is None:
             return None
-        return self.current_config, input_dir
+
+        # Checked again at run time: the profile may have been edited since
+        # it was selected
+        path = self.current_config_path
+        try:
+            cfg = self._load_config(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Config", f"Cannot read {path.name}:\n{e}")
+            return None
+        if cfg is not self.current_config:
+            self._set_config(path, cfg)
+        return cfg, input_dir
 
     def _run_prepare_lists(self) -> None:
         res = self._ensure_config_and_dir()
@@ -581,63 +1040,92 @@ class MainWindow(QMainWindow):
             f"Calibration lists created for '{input_dir.name}'.",
         )
 
+    def _set_calibration_busy(self, busy: bool, status: str = "") -> None:
+        """Lock the calibration buttons while a run is on the thread pool."""
+        for btn in (self.btn_prepare, self.btn_masters, self.btn_full):
+            btn.setEnabled(not busy)
+        if status:
+            self.lbl_status.setText(status)
+
     def _run_create_masters(self) -> None:
         res = self._ensure_config_and_dir()
         if res is None:
             return
-        _, input_dir = res
+        cfg, input_dir = res
 
         from calibration import mkmasterbias, mkmasterdark, mkmasterflats
+        from calibration.calib_core import CalibrationPipeline
 
-        # Build a temporary pipeline just to get cfg with absolute directories
-        try:
-            pipeline = CalibrationPipeline(
-                str(self.current_config_path),
-                root_dir=str(input_dir),
-            )
-        except TypeError:
-            # fallback for older CalibrationPipeline without root_dir
-            pipeline = CalibrationPipeline(str(self.current_config_path))
-
-        cfg = pipeline.cfg  # this cfg now has working_dir/results_dir under input_dir
-
-        # Collect all FITS files in the selected directory
-        dir_path = Path(str(input_dir)).expanduser().resolve()
-        fits_files = sorted(
-            str(p.resolve())
-            for p in dir_path.iterdir()
-            if p.is_file() and p.suffix in {".fits", ".fit", ".FITS", ".FIT"}
+        # Build a temporary pipeline just to create the directories under input_dir
+        CalibrationPipeline(
+            str(self.current_config_path),
+            root_dir=str(input_dir),
+            cfg=cfg,  # the same profile the full calibration uses
         )
+
+        bias_method = cfg.get("IMAGE_PROCESSING", "bias_subtraction_method")
+        bias_sigma = cfg.get("IMAGE_PROCESSING", "bias_subtraction_sigma")
+        dark_method = cfg.get("IMAGE_PROCESSING", "dark_correction_method")
+
+        # Collect all FITS files in the selected directory (already resolved)
+        fits_files = sorted(_iter_files(input_dir, _FITS_EXTS))
         if not fits_files:
             QMessageBox.warning(
                 self, "Master frames", "No FITS files found in the selected directory."
             )
             return
 
-        # Master bias
-        masterbias_path = mkmasterbias.create_master_bias(
-            fits_files,
-            cfg,
-            output_filename="masterbias.fits",
-            method=cfg.get("IMAGE_PROCESSING", "bias_subtraction_method"),
-            sigma=cfg.get("IMAGE_PROCESSING", "bias_subtraction_sigma"),
-            make_png_flag=False,
-            verbose=True,
-        )
-
-        # Master dark
-        masterdark_path = mkmasterdark.make_master_dark(
-            fits_files,
-            cfg,
-            output_filename="masterdark.fits",
-            method=cfg.get("IMAGE_PROCESSING", "dark_correction_method"),
-            make_png_flag=False,
-            verbose=True,
+        def create_masters() -> tuple[str, str]:
+            # The three masters each read the raw frames and write their own
+            # files, so they are built side by side; the reads, medians and
+            # the flat kernel all release the GIL.
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                # Master bias
+                bias = pool.submit(
+                    mkmasterbias.create_master_bias,
+                    fits_files,
+                    cfg,
+                    output_filename="masterbias.fits",
+                    method=bias_method,
+                    sigma=bias_sigma,
+                    make_png_flag=False,
+                    verbose=True,
+                )
+
+                # Master dark
+                dark = pool.submit(
+                    mkmasterdark.make_master_dark,
+                    fits_files,
+                    cfg,
+                    output_filename="masterdark.fits",
+                    method=dark_method,
+                    make_png_flag=False,
+                    verbose=True,
+                )
+
+                # Master flats
+                flats = pool.submit(
+                    mkmasterflats.create_master_flats, fits_files, cfg, verbose=True
+                )
+                masterbias_path = bias.result()
+                masterdark_path = dark.result()
+                flats.result()
+            return masterbias_path, masterdark_path
+
+        worker = Worker(create_masters)
+        worker.signals.result.connect(self._on_masters_created)
+        worker.signals.error.connect(
+            lambda tb, text: QMessageBox.critical(
+                self, "Master frames", f"Creating master frames failed:\n{text}"
+            )
         )
+        worker.signals.finished.connect(lambda: self._set_calibration_busy(False))
+        self._set_calibration_busy(True, "Creating master frames…")
+        self._start_worker(worker)
 
-        # Master flats
-        mkmasterflats.create_master_flats(fits_files, cfg, verbose=True)
-
+    def _on_masters_created(self, paths: tuple[str, str]) -> None:
+        masterbias_path, masterdark_path = paths
+        self.lbl_status.setText("Master frames created")
         QMessageBox.information(
             self,
             "Master frames",
@@ -658,6 +1146,8 @@ class MainWindow(QMainWindow):
             return
         cfg, input_dir = res
 
+        from calibration.calib_core import CalibrationPipeline
+
         if self.current_config_path is None:
             QMessageBox.warning(
                 self, "Config", "No config file path found for the selected profile."
@@ -665,54 +1155,61 @@ class MainWindow(QMainWindow):
             return
 
         # *** important: use the selected directory as root_dir ***
-        try:
-            pipeline = CalibrationPipeline(
-                str(self.current_config_path),
-                root_dir=str(input_dir),  # <— this is new
-            )
-        except TypeError:
-            # fallback if older CalibrationPipeline without root_dir argument
-            pipeline = CalibrationPipeline(str(self.current_config_path))
-
-        log_lines: List[str] = []
+        pipeline = CalibrationPipeline(
+            str(self.current_config_path),
+            root_dir=str(input_dir),  # <— this is new
+            cfg=cfg,  # re-checked against the file in _ensure_config_and_dir
+        )
 
         def log(msg: str) -> None:
-            log_lines.append(msg)
             print(msg)
+            worker.signals.log.emit(msg)  # shown in the status bar
 
-        try:
+        def calibrate() -> List[str]:
             final_files = pipeline.run_full_calibration(
                 raw_source=str(input_dir),
                 source_type="directory",
                 verbose=True,
                 log_callback=log,
             )
-        except Exception as e:  # noqa: BLE001
-            QMessageBox.critical(
+            # If pipeline returned nothing, still try to pick up any -bdf frames from results/.
+            if not final_files:
+                results_dir = Path(input_dir) / "results"
+                if results_dir.is_dir():
+                    final_files = sorted(_iter_files(results_dir, _FITS_EXTS, "-bdf"))
+            return [str(p) for p in final_files]
+
+        worker = Worker(calibrate)
+        worker.signals.log.connect(self.lbl_status.setText)
+        worker.signals.result.connect(
+            lambda files, c=self.current_config_path, d=input_dir: (
+                self._on_calibration_done(c, d, files)
+            )
+        )
+        worker.signals.error.connect(
+            lambda tb, text: QMessageBox.critical(
                 self,
                 "Calibration error",
-                f"Full calibration failed:\n{e}",
+                f"Full calibration failed:\n{text}",
             )
-            return
-
-        # If pipeline returned nothing, still try to pick up any -bdf frames from results/.
-        if not final_files:
-            results_dir = Path(input_dir) / "results"
-            if results_dir.is_dir():
-                final_files = [
-                    str(p)
-                    for p in sorted(results_dir.glob("*.fits"))
-                    if "-bdf" in p.name.lower()
-                ]
+        )
+        worker.signals.finished.connect(lambda: self._set_calibration_busy(False))
+        self._set_calibration_busy(True, "Running full calibration…")
+        self._start_worker(worker)
 
-        self.calibrated_files = [Path(p) for p in final_files]
+    def _on_calibration_done(
+        self, config_path: Path, input_dir: Path, files: List[str]
+    ) -> None:
+        self.calibrated_files = files
 
         self.lbl_status.setText(
             f"Calibration complete: {len(self.calibrated_files)} calibrated science frames."
         )
 
         preview_count = min(5, len(self.calibrated_files))
-        preview_names = "\n".join(p.name for p in self.calibrated_files[:preview_count])
+        preview_names = "\n".join(
+            os.path.basename(p) for p in self.calibrated_files[:preview_count]
+        )
         extra = ""
         if len(self.calibrated_files) > preview_count:
             extra = f"\n… and {len(self.calibrated_files) - preview_count} more."
@@ -721,7 +1218,7 @@ class MainWindow(QMainWindow):
             self,
             "Full calibration",
             f"Calibration finished.\n"
-            f"Config: {Path(self.current_config_path).name}\n"
+            f"Config: {Path(config_path).name}\n"
             f"Input directory: {input_dir}\n"
             f"Calibrated frames: {len(self.calibrated_files)}\n\n"
             f"Examples:\n{preview_names}{extra}",
@@ -729,19 +1226,11 @@ class MainWindow(QMainWindow):
 
         # Show 'Upload to BHTOM' if we have frames
         self.btn_upload_calibrated.setVisible(bool(self.calibrated_files))
-        self.btn_upload_calibrated.setEnabled(
-            bool(self.calibrated_files) and self.bhtom_token is not None
-        )
+        self._update_upload_button()
 
         # Automatically open first calibrated frame in the viewer
         if self.calibrated_files:
-            try:
-                arr = fits.getdata(str(self.calibrated_files[0])).astype(np.float32)
-                self.loaded_frames = [(self.calibrated_files[0], arr)]
-                self.current_frame_index = 0
-                self._show_current_frame()
-            except Exception:
-                pass
+            self._load_files(self.calibrated_files[:1])
 
     # ------------------------------------------------------------------
     # BHTOM integration
@@ -769,11 +1258,7 @@ class MainWindow(QMainWindow):
         self.bhtom_username = username
         self.bhtom_token = token
         self.lbl_status.setText("BHTOM: authenticated")
-        self._refresh_bhtom_ui()
-
-        # If we already have calibrated frames, allow upload
-        if self.calibrated_files:
-            self.btn_upload_calibrated.setEnabled(True)
+        self._refresh_bhtom_ui()  # also allows upload if frames are ready
 
     def _on_upload_calibrated_clicked(self) -> None:
         """
@@ -798,7 +1283,7 @@ class MainWindow(QMainWindow):
 
         # 3) Quick preview/confirmation of what will be uploaded
         max_preview = 10
-        names = [p.name for p in self.calibrated_files[:max_preview]]
+        names = [os.path.basename(p) for p in self.calibrated_files[:max_preview]]
         preview = "\n".join(names)
         extra = ""
         if len(self.calibrated_files) > max_preview:
@@ -866,37 +1351,55 @@ class MainWindow(QMainWindow):
         # 8) Perform upload
         paths = [Path(p) for p in self.calibrated_files]
 
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            bhtom_api.upload_calibrated_files(
-                files=paths,
-                token=self.bhtom_token,
-                target=target_name,
-                observatory=observatory_oname,
-                filter_name=filter_name,
+        token = self.bhtom_token
+
+        def upload() -> Optional[str]:
+            # an expected upload failure comes back as the result; anything
+            # else reaches the error signal
+            try:
+                bhtom_api.upload_calibrated_files(
+                    files=paths,
+                    token=token,
+                    target=target_name,
+                    observatory=observatory_oname,
+                    filter_name=filter_name,
+                )
+            except bhtom_api.BHTOMUploadError as exc:
+                return str(exc)
+            return None
+
+        def on_result(failure: Optional[str]) -> None:
+            if failure is not None:
+                self.lbl_status.setText("BHTOM: upload failed")
+                QMessageBox.critical(self, "Upload failed", failure)
+                return
+            self.lbl_status.setText(f"BHTOM: uploaded {len(paths)} file(s)")
+            QMessageBox.information(
+                self,
+                "Upload completed",
+                (
+                    f"Successfully uploaded {len(paths)} calibrated file(s) to BHTOM.\n\n"
+                    f"Target: {target_name}\n"
+                    f"Observatory: {observatory_oname}\n"
+                    f"Filter: {filter_name}"
+                ),
             )
-        except bhtom_api.BHTOMUploadError as exc:
-            QApplication.restoreOverrideCursor()
-            QMessageBox.critical(self, "Upload failed", str(exc))
-            return
-        except Exception as exc:  # safety net
-            QApplication.restoreOverrideCursor()
-            QMessageBox.critical(
+
+        worker = Worker(upload)
+        worker.signals.result.connect(on_result)
+        worker.signals.error.connect(
+            lambda tb, text: QMessageBox.critical(
                 self,
                 "Unexpected error",
-                f"An unexpected error occurred while uploading:\n{exc}",
+                f"An unexpected error occurred while uploading:\n{text}",
             )
-            return
-        finally:
-            QApplication.restoreOverrideCursor()
-
-        QMessageBox.information(
-            self,
-            "Upload completed",
-            (
-                f"Successfully uploaded {len(paths)} calibrated file(s) to BHTOM.\n\n"
-                f"Target: {target_name}\n"
-                f"Observatory: {observatory_oname}\n"
-                f"Filter: {filter_name}"
-            ),
-        )
\ No newline at end of file
+        )
+        worker.signals.finished.connect(self._on_upload_finished)
+        self._uploading = True
+        self._update_upload_button()
+        self.lbl_status.setText(f"BHTOM: uploading {len(paths)} file(s)…")
+        self._start_worker(worker)
+
+    def _on_upload_finished(self) -> None:
+        self._uploading = False
+        self._update_upload_button()
\ No newline at end of file
@@ -13,13 +13,14 @@ class WorkerSignals(QObject):
     Signals available from a running worker thread.
 
     finished: job is done (success or failure).
-    error:    string with traceback if an exception occurred.
+    error:    traceback and exception text ("Type: message") if an
+              exception occurred.
     result:   any object returned by the function.
     log:      log / status messages as strings.
     """
 
     finished = Signal()
-    error = Signal(str)
+    error = Signal(str, str)
     result = Signal(object)
     log = Signal(str)
 
@@ -49,9 +50,12 @@ class Worker(QRunnable):
         """Run the function with its arguments."""
         try:
             result = self.fn(*self.args, **self.kwargs)
-        except Exception:
+        except BaseException as e:
+            # BaseException too: a SystemExit from a task must still reach the
+            # error slot instead of being printed by the binding.
             tb = traceback.format_exc()
-            self.signals.error.emit(tb)
+            text = "".join(traceback.format_exception_only(type(e), e)).rstrip()
+            self.signals.error.emit(tb, text)
         else:
             self.signals.result.emit(result)
         finally:
@@ -0,0 +1,100 @@
+# tests/test_main_window.py
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from astropy.io import fits
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from gui.main_window import MainWindow
+
+app = QApplication.instance() or QApplication([])
+
+
+def _write_frames(directory: str, n: int) -> list[str]:
+    paths = []
+    for i in range(n):
+        path = os.path.join(directory, f"frame{i}.fits")
+        fits.PrimaryHDU(np.full((32, 32), i, dtype=np.float32)).writeto(path)
+        paths.append(path)
+    return paths
+
+
+class BlinkTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.window = MainWindow()
+
+    def tearDown(self) -> None:
+        self.window.close()
+        self._wait_for_loads()
+        self.tmp.cleanup()
+
+    def _wait_for_loads(self) -> None:
+        QThreadPool.globalInstance().waitForDone()
+        app.processEvents()
+
+    def test_reload_while_blinking_keeps_blinking(self) -> None:
+        w = self.window
+        paths = _write_frames(self.tmp.name, 3)
+        w._load_files(paths)
+        self._wait_for_loads()
+        w.btn_blink.setChecked(True)
+        self.assertTrue(w.blink_timer.isActive())
+
+        # a tick lands after the old frames were released, before any new one
+        w._load_files(paths[:2])
+        w.blink_timer.stop()
+        w._on_blink_timer()
+        self.assertFalse(w.blink_timer.isActive())
+
+        self._wait_for_loads()
+        self.assertEqual(len(w.loaded_frames), 2)
+        self.assertTrue(w.blink_timer.isActive())
+
+        shown = w.current_frame_index
+        w._on_blink_timer()
+        self.assertNotEqual(w.current_frame_index, shown)
+
+
+class ConfigTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.window = MainWindow()
+
+    def tearDown(self) -> None:
+        self.window.close()
+        QThreadPool.globalInstance().waitForDone()
+        self.tmp.cleanup()
+
+    def test_selecting_a_deleted_profile_warns(self) -> None:
+        w = self.window
+        src = w.cmb_config.itemData(0)
+        path = Path(self.tmp.name) / "gone.ini"
+        shutil.copy(src, path)
+        w.cmb_config.addItem("gone", path)
+        w._on_config_changed(w.cmb_config.count() - 1)
+        self.assertIn(path, w._config_cache)
+
+        w._on_config_changed(0)
+        path.unlink()
+        with mock.patch.object(QMessageBox, "warning") as warning:
+            w._on_config_changed(w.cmb_config.count() - 1)
+        warning.assert_called_once()
+        self.assertIsNone(w.current_config)
+        self.assertIsNone(w.current_config_path)
+        self.assertNotIn(path, w._config_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
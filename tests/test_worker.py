@@ -0,0 +1,40 @@
+# tests/test_worker.py
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6.QtCore import QCoreApplication, QThreadPool
+
+from gui.worker import Worker
+
+app = QCoreApplication.instance() or QCoreApplication([])
+
+
+def _fail() -> None:
+    raise ValueError("first line\n  indented second line\nthird line")
+
+
+class WorkerErrorTest(unittest.TestCase):
+    def test_error_carries_the_full_exception_text(self) -> None:
+        errors = []
+        worker = Worker(_fail)
+        worker.signals.error.connect(lambda tb, text: errors.append((tb, text)))
+        QThreadPool.globalInstance().start(worker)
+        QThreadPool.globalInstance().waitForDone()
+        app.processEvents()
+
+        self.assertEqual(len(errors), 1)
+        tb, text = errors[0]
+        self.assertIn("Traceback", tb)
+        self.assertEqual(
+            text, "ValueError: first line\n  indented second line\nthird line"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()